@@ -7,18 +7,35 @@ to another, with options to change the output format preset.
 """
 
 import argparse
+import multiprocessing
+import shutil
 import signal
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from copy import deepcopy
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import TextIO
 
 import pylhe
 
 from lheutils.cli.util import (
+    EVENTS_PER_CHUNK,
+    LHE_END_TAG,
+    add_jobs_argument,
     add_output_format_argument,
+    buffered_stdout,
     create_base_parser,
+    detect_input_format,
+    detect_output_format,
+    is_hdf5_file,
+    iter_raw_lhe_blocks,
+    open_lhe_binary,
+    open_lhe_output,
+    open_stdin,
     parse_output_format,
+    read_lhe_file,
 )
 
 # We do not want a Python Exception on broken pipe, which happens when piping to 'head' or 'less'
@@ -45,21 +62,26 @@ def _find_weight_group(
     return None
 
 
-def _find_weight_location(initrwgt: pylhe.LHEInitRWGT, weight_id: str) -> str | None:
-    """Return where a weight ID already exists, if present."""
+def _weight_group_location(group: pylhe.LHEInitRWGTWeightGroup) -> str:
+    """Describe a weight group for error messages."""
+    group_name = group.name or group.attributes.get("type", "")
+    if group_name:
+        return f"weight group '{group_name}'"
+    return "<initrwgt>"
+
+
+def _weight_locations(initrwgt: pylhe.LHEInitRWGT) -> dict[str, str]:
+    """Map every defined weight ID to where it is defined, in a single pass."""
+    locations: dict[str, str] = {}
     for entry in initrwgt.entries:
         if isinstance(entry, pylhe.LHEInitRWGTWeight):
-            if entry.id == weight_id:
-                return "<initrwgt>"
+            locations.setdefault(entry.id, "<initrwgt>")
             continue
 
+        location = _weight_group_location(entry)
         for weight in entry.weights:
-            if weight.id == weight_id:
-                group_name = entry.name or entry.attributes.get("type", "")
-                if group_name:
-                    return f"weight group '{group_name}'"
-                return "<initrwgt>"
-    return None
+            locations.setdefault(weight.id, location)
+    return locations
 
 
 def _add_initrwgt_weight(
@@ -67,10 +89,15 @@ def _add_initrwgt_weight(
     group_name: str,
     weight_id: str,
     weight_text: str,
+    weight_locations: dict[str, str],
 ) -> str | None:
-    """Add a weight definition to the initrwgt header block."""
+    """Add a weight definition to the initrwgt header block.
+
+    ``weight_locations`` holds the already defined weight IDs, see
+    ``_weight_locations``, and is updated with the added weight.
+    """
     header = _ensure_header(lhefile)
-    existing_location = _find_weight_location(header.initrwgt, weight_id)
+    existing_location = weight_locations.get(weight_id)
     if existing_location is not None:
         return f"Error: Weight ID '{weight_id}' already exists in {existing_location}"
 
@@ -88,6 +115,7 @@ def _add_initrwgt_weight(
         header.initrwgt.entries.append(group)
 
     group.weights.append(weight)
+    weight_locations[weight_id] = _weight_group_location(group)
     return None
 
 
@@ -99,21 +127,135 @@ def _keep_only_weight_definition(
     if lhefile.header is None:
         return
 
-    kept_entries: list[pylhe.InitRWGTEntry] = []
-    for entry in lhefile.header.initrwgt.entries:
-        if isinstance(entry, pylhe.LHEInitRWGTWeight):
-            if entry.id == only_weight_id:
-                kept_entries.append(entry)
-            continue
+    entries = lhefile.header.initrwgt.entries
+    for entry in entries:
+        if isinstance(entry, pylhe.LHEInitRWGTWeightGroup):
+            entry.weights = [
+                weight for weight in entry.weights if weight.id == only_weight_id
+            ]
+
+    # Drop the now empty groups and other direct weights in place
+    dropped = [
+        index
+        for index, entry in enumerate(entries)
+        if (
+            entry.id != only_weight_id
+            if isinstance(entry, pylhe.LHEInitRWGTWeight)
+            else not entry.weights
+        )
+    ]
+    for index in reversed(dropped):
+        del entries[index]
+
+
+def _append_weight(
+    events: Iterable[pylhe.LHEEvent], append_weight_id: str
+) -> Iterator[pylhe.LHEEvent]:
+    """Copy the central event weight into the given weight ID."""
+    for event in events:
+        event.weights[append_weight_id] = event.eventinfo.weight
+        yield event
+
+
+def _keep_only_weight(
+    events: Iterable[pylhe.LHEEvent], only_weight_id: str
+) -> Iterator[pylhe.LHEEvent]:
+    """Promote the given weight to the central weight and drop all others."""
+    for event in events:
+        # Events without the requested weight are skipped
+        if only_weight_id in event.weights:
+            event.eventinfo.weight = event.weights[only_weight_id]
+            event.weights = {only_weight_id: event.eventinfo.weight}
+            yield event
+
+
+def _append_and_keep_only_weight(
+    events: Iterable[pylhe.LHEEvent], append_weight_id: str, only_weight_id: str
+) -> Iterator[pylhe.LHEEvent]:
+    """Apply ``_append_weight`` and then ``_keep_only_weight`` in one loop."""
+    for event in events:
+        event.weights[append_weight_id] = event.eventinfo.weight
+        if only_weight_id in event.weights:
+            event.eventinfo.weight = event.weights[only_weight_id]
+            event.weights = {only_weight_id: event.eventinfo.weight}
+            yield event
+
+
+def _transform_events(
+    events: Iterable[pylhe.LHEEvent],
+    append_weight_id: str | None,
+    only_weight_id: str | None,
+) -> Iterator[pylhe.LHEEvent]:
+    """Apply the per-event weight modifications to a stream of events.
+
+    The loop is picked once per file, so no per-event mode checks are needed.
+    """
+    if append_weight_id is not None and only_weight_id is not None:
+        return _append_and_keep_only_weight(events, append_weight_id, only_weight_id)
+    if append_weight_id is not None:
+        return _append_weight(events, append_weight_id)
+    if only_weight_id is not None:
+        return _keep_only_weight(events, only_weight_id)
+    return iter(events)
+
+
+@dataclass(frozen=True)
+class _EventChunkConverter:
+    """Parse, modify and serialize a chunk of raw event blocks in a worker."""
+
+    prefix: str
+    lheformat: pylhe.LHEXMLFormat
+    append_weight_id: str | None
+    only_weight_id: str | None
+
+    def __call__(self, blocks: list[bytes]) -> str:
+        lhefile = pylhe.LHEFile.fromstring(
+            self.prefix + b"".join(blocks).decode() + LHE_END_TAG
+        )
+        return "".join(
+            event.tolhe(lheformat=self.lheformat) + "\n"
+            for event in _transform_events(
+                lhefile.events, self.append_weight_id, self.only_weight_id
+            )
+        )
 
-        kept_weights = [
-            weight for weight in entry.weights if weight.id == only_weight_id
-        ]
-        if kept_weights:
-            entry.weights = kept_weights
-            kept_entries.append(entry)
 
-    lhefile.header.initrwgt.entries = kept_entries
+def _write_parallel(
+    lhefile: pylhe.LHEFile,
+    output_lhefile: pylhe.LHEFile,
+    raw_blocks: Iterator[bytes],
+    output_stream: TextIO,
+    lheformat: pylhe.LHEXMLFormat,
+    append_weight_id: str | None,
+    only_weight_id: str | None,
+    jobs: int,
+) -> None:
+    """Write an LHE file whose events are converted chunk-wise in worker processes."""
+    converter = _EventChunkConverter(
+        # Workers only need the weight definitions and the init block to parse events
+        prefix=pylhe.LHEFile(
+            init=lhefile.init,
+            header=(
+                pylhe.LHEHeader(initrwgt=lhefile.header.initrwgt)
+                if lhefile.header is not None
+                else None
+            ),
+            version=lhefile.version,
+        )
+        .tolhe()
+        .removesuffix(LHE_END_TAG),
+        lheformat=lheformat,
+        append_weight_id=append_weight_id,
+        only_weight_id=only_weight_id,
+    )
+    output_stream.write(
+        output_lhefile.tolhe(lheformat=lheformat).removesuffix(LHE_END_TAG)
+    )
+    chunks = iter(lambda: list(islice(raw_blocks, EVENTS_PER_CHUNK)), [])
+    with multiprocessing.Pool(jobs) as pool:
+        # imap keeps the input order of the chunks
+        output_stream.writelines(pool.imap(converter, chunks))
+    output_stream.write(LHE_END_TAG)
 
 
 def convert_lhe_file(
@@ -123,6 +265,7 @@ def convert_lhe_file(
     append_lhe_weight: tuple[str, str, str] | None = None,
     only_weight_id: str | None = None,
     add_initrwgt: list[tuple[str, str, str]] | None = None,
+    jobs: int = 1,
 ) -> tuple[int, str]:
     """Convert an LHE file with specified options.
 
@@ -133,13 +276,47 @@ def convert_lhe_file(
         append_lhe_weight: Optional tuple containing LHE weight group name and weight ID to append LHE weight to each event
         only_weight_id: Optional weight ID to keep; all other weights will be removed
         add_initrwgt: Optional list of tuples containing LHE weight group name, weight ID, and weight text to add to the init-rwgt block
+        jobs: Number of worker processes converting events (XML input and output only)
     """
     try:
+        if (
+            output_format is None
+            and output_file is not None
+            and input_file != "-"
+            and append_lhe_weight is None
+            and only_weight_id is None
+            and not add_initrwgt
+            and detect_input_format(input_file) == detect_output_format(output_file)
+        ):
+            # Nothing to convert, copy the bytes without parsing (sendfile on Linux)
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(input_file, output_file)
+            return 0, "Conversion successful"
+
+        if output_format is None:
+            output_format = (
+                pylhe.DEFAULT_FORMAT
+                if output_file is None
+                else detect_output_format(output_file)
+            )
+        parallel = (
+            jobs > 1
+            and isinstance(output_format, pylhe.LHEXMLFormat)
+            and (input_file == "-" or not is_hdf5_file(input_file))
+        )
+
         # Read the input file
-        if input_file == "-":
-            lhefile = pylhe.LHEFile.frombuffer(sys.stdin)
+        raw_blocks: Iterator[bytes] = iter(())
+        if parallel:
+            # Only the prefix up to </init> is parsed here, events are parsed by the workers
+            raw_blocks = iter_raw_lhe_blocks(
+                sys.stdin.buffer if input_file == "-" else open_lhe_binary(input_file)
+            )
+            lhefile = pylhe.LHEFile.fromstring(next(raw_blocks).decode() + LHE_END_TAG)
+        elif input_file == "-":
+            lhefile = pylhe.LHEFile.frombuffer(open_stdin())
         else:
-            lhefile = pylhe.LHEFile.fromfile(input_file)
+            lhefile = read_lhe_file(input_file)
 
         output_lhefile = pylhe.LHEFile(
             init=lhefile.init,
@@ -149,50 +326,41 @@ def convert_lhe_file(
             extra_attributes=lhefile.extra_attributes.copy(),
         )
 
-        if add_initrwgt:
-            for group_name, weight_id, weight_text in add_initrwgt:
+        new_weights = list(add_initrwgt or [])
+        if append_lhe_weight is not None:
+            new_weights.append(append_lhe_weight)
+        if new_weights:
+            weight_locations = (
+                _weight_locations(output_lhefile.header.initrwgt)
+                if output_lhefile.header is not None
+                else {}
+            )
+            for group_name, weight_id, weight_text in new_weights:
                 error_message = _add_initrwgt_weight(
                     output_lhefile,
                     group_name,
                     weight_id,
                     weight_text,
+                    weight_locations,
                 )
                 if error_message is not None:
                     return 1, error_message
-        if append_lhe_weight is not None:
-            group_name, weight_id, weight_text = append_lhe_weight
-            error_message = _add_initrwgt_weight(
-                output_lhefile,
-                group_name,
-                weight_id,
-                weight_text,
-            )
-            if error_message is not None:
-                return 1, error_message
         if only_weight_id is not None:
             _keep_only_weight_definition(output_lhefile, only_weight_id)
 
-        # Event loop generator with modifications if needed
-        def _generator() -> Iterable[pylhe.LHEEvent]:
-            for event in lhefile.events:
-                if append_lhe_weight is not None:
-                    _group_name, weight_id, _weight_text = append_lhe_weight
-                    event.weights[weight_id] = event.eventinfo.weight
-                if only_weight_id is not None:
-                    # Replace the central weight with the specified weight and remove others
-                    if only_weight_id in event.weights:
-                        event.eventinfo.weight = event.weights[only_weight_id]
-                        # After promoting this weight to central, remove all alternate weights
-                        event.weights = {only_weight_id: event.eventinfo.weight}
-                    else:
-                        # skip this event
-                        continue
-                yield event
-
-        # Write the output file
+        append_weight_id = (
+            append_lhe_weight[1] if append_lhe_weight is not None else None
+        )
+
+        if not parallel:
+            output_lhefile.events = _transform_events(
+                lhefile.events, append_weight_id, only_weight_id
+            )
+
+        # Write the output file, creating its directory only now
+        if output_file is not None:
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
         if output_file is None:
-            if output_format is None:
-                output_format = pylhe.DEFAULT_FORMAT
             if (
                 not isinstance(output_format, pylhe.LHEXMLFormat)
                 or output_format.compress
@@ -201,22 +369,52 @@ def convert_lhe_file(
                     1,
                     "Error: Stdout only supports uncompressed XML output formats",
                 )
-            output_lhefile.events = _generator()
-            output_lhefile.write(
-                sys.stdout,
-                lheformat=output_format,
-            )
+            with buffered_stdout() as output_stream:
+                if parallel:
+                    _write_parallel(
+                        lhefile,
+                        output_lhefile,
+                        raw_blocks,
+                        output_stream,
+                        output_format,
+                        append_weight_id,
+                        only_weight_id,
+                        jobs,
+                    )
+                else:
+                    output_lhefile.write(
+                        output_stream,
+                        lheformat=output_format,
+                    )
+        elif parallel and isinstance(output_format, pylhe.LHEXMLFormat):
+            with open_lhe_output(output_file, output_format) as output_stream:
+                _write_parallel(
+                    lhefile,
+                    output_lhefile,
+                    raw_blocks,
+                    output_stream,
+                    output_format,
+                    append_weight_id,
+                    only_weight_id,
+                    jobs,
+                )
+        elif isinstance(output_format, pylhe.LHEXMLFormat):
+            with open_lhe_output(output_file, output_format) as output_stream:
+                output_lhefile.write(output_stream, lheformat=output_format)
         else:
-            output_lhefile.events = _generator()
             output_lhefile.tofile(
                 output_file,
                 lheformat=output_format,
             )
 
+    except shutil.SameFileError:
+        return 1, f"Error: Input and output file '{input_file}' are the same"
     except FileNotFoundError:
         if input_file == "-":
             return 1, "Error: Unable to read from stdin"
         return 1, f"Error: Input file '{input_file}' not found"
+    except OSError as e:
+        return 1, f"Error: Unable to convert '{input_file}': {e}"
     return 0, "Conversion successful"
 
 
@@ -234,6 +432,7 @@ Examples:
   lhe2lhe -i input.lhe -o output.lhe --output-format no-weights # XML output without alternate weights
   lhe2lhe -i input.lhe -o output.h5 --output-format hdf5        # HDF5/LHEH5 output
   lhe2lhe -i input.lhe -o output.h5 --output-format hdf5-gz     # HDF5 with gzip-compressed datasets
+  lhe2lhe -i input.lhe -o output.lhe -j 8                # Convert events with 8 processes
   lhe2lhe -i input.lhe | gzip > output.lhe.gz            # Pipe to compress
   cat input.lhe | lhe2lhe                                 # Convert from stdin to stdout
   lhe2lhe < input.lhe > output.lhe                       # Redirect stdin/stdout
@@ -284,22 +483,15 @@ Output formats:
         help="Removes all weights but the specified weight. Also the central xwgtup LHE event weight is replaced.",
     )
 
+    add_jobs_argument(
+        parser,
+        help_text="Number of worker processes converting events (default: 1)",
+    )
+
     args = parser.parse_args()
 
     output_format = parse_output_format(args.output_format)
 
-    # Validate input file exists (skip validation for stdin)
-    if args.input != "-":
-        input_path = Path(args.input)
-        if not input_path.exists():
-            print(f"Error: Input file '{args.input}' does not exist", file=sys.stderr)
-            sys.exit(1)
-
-    # Check if output directory exists and create it if needed
-    if args.output is not None:
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
     # Perform the conversion
     retcode, message = convert_lhe_file(
         input_file=args.input,
@@ -308,6 +500,7 @@ Output formats:
         append_lhe_weight=args.append_lhe_weight,
         only_weight_id=args.only_weight_id,
         add_initrwgt=args.add_initrwgt,
+        jobs=args.jobs,
     )
     if retcode != 0:
         print(message, file=sys.stderr)
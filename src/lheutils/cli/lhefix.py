@@ -7,29 +7,61 @@ them as a generator until completion or exception.
 """
 
 import argparse
+import multiprocessing
 import os
 import sys
 import tempfile
 from collections.abc import Iterable
+from contextlib import suppress
 from copy import deepcopy
 from pathlib import Path
 
 import pylhe
 
 from lheutils.cli.util import (
+    add_jobs_argument,
     add_weight_format_argument,
     create_base_parser,
     create_output_format,
+    open_lhe_output,
+    open_stdin,
     parse_weight_format,
+    read_lhe_file,
 )
 
 
+def _sync_file(path: str) -> None:
+    """Flush the data of a written file to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        getattr(os, "fdatasync", os.fsync)(fd)
+    finally:
+        os.close(fd)
+
+
+def _sync_directory(path: str) -> None:
+    """Flush a directory entry update, e.g. a rename, to disk where supported."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        # Some filesystems do not support syncing directories
+        pass
+    finally:
+        os.close(fd)
+
+
 def fix_file(
     filepath: str | None = None,
     compress: bool = False,
     suffix: str | None = None,
     weight_format: pylhe.LHEWeightFormat = pylhe.LHEWeightFormat.RWGT,
-) -> None:
+    durable: bool = False,
+) -> bool:
     """Fix an LHE file from filepath or stdin.
 
     Args:
@@ -37,13 +69,17 @@ def fix_file(
         compress: Whether to gzip-compress the output file (ignored for stdin).
         suffix: Suffix to add to the output filename (ignored for stdin).
         weight_format: How to serialize event weights in output
+        durable: Whether to flush the output to disk before it replaces the target (ignored for stdin).
+
+    Returns:
+        Whether the fixed output was written.
     """
     try:
         # Read the input
         if filepath is None:
-            lhefile = pylhe.LHEFile.frombuffer(sys.stdin)
+            lhefile = pylhe.LHEFile.frombuffer(open_stdin())
         else:
-            lhefile = pylhe.LHEFile.fromfile(filepath)
+            lhefile = read_lhe_file(filepath)
 
         # Determine output path for file mode
         output_path = ""
@@ -100,6 +136,7 @@ def fix_file(
                 dir=filepath_obj.parent,
             )
 
+            replaced = False
             try:
                 # Close the file descriptor since pylhe will open its own
                 os.close(temp_fd)
@@ -109,19 +146,21 @@ def fix_file(
                 os.chmod(temp_path, original_stat.st_mode)
 
                 # Write to temporary file
-                fixed_lhefile.tofile(
-                    temp_path,
-                    lheformat=create_output_format(weight_format, compress=compress),
-                )
+                lheformat = create_output_format(weight_format, compress=compress)
+                with open_lhe_output(temp_path, lheformat) as output_stream:
+                    fixed_lhefile.write(output_stream, lheformat=lheformat)
+                if durable:
+                    _sync_file(temp_path)
 
                 # Atomically replace/create output file with temporary file
                 os.replace(temp_path, output_path)
+                replaced = True
 
-            except Exception as e:
+            finally:
                 # Clean up temporary file on error
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                raise e
+                if not replaced:
+                    with suppress(FileNotFoundError):
+                        os.unlink(temp_path)
 
     except Exception as e:
         if filepath is None:
@@ -129,6 +168,9 @@ def fix_file(
             sys.exit(1)
         else:
             print(f"Error fixing {filepath}: {e}", file=sys.stderr)
+        return False
+
+    return True
 
 
 def main() -> None:
@@ -136,7 +178,7 @@ def main() -> None:
     parser = create_base_parser(
         prog="lhefix",
         description="Fix broken LHE files. Reads from stdin by default or fixes multiple files in place. "
-        "For parallel processing, use GNU parallel: 'parallel -j 8 lhefix ::: *.lhe'.",
+        "For parallel processing, use --jobs: 'lhefix -j 8 *.lhe'.",
     )
 
     parser.add_argument(
@@ -158,6 +200,19 @@ def main() -> None:
         help_text="Weight format to use in output files (default: rwgt).",
     )
 
+    parser.add_argument(
+        "--durable",
+        choices=("off", "file", "dir"),
+        default="off",
+        help="Flush fixed files to disk before replacing the originals ('file'), "
+        "and also the directory entries once all files are done ('dir') (default: off).",
+    )
+
+    add_jobs_argument(
+        parser,
+        help_text="Number of files to fix in parallel worker processes (default: 1)",
+    )
+
     parser.add_argument(
         "files",
         nargs="*",
@@ -173,11 +228,33 @@ def main() -> None:
         fix_file(None, args.compress, args.suffix, weight_format)
     else:
         # Fix multiple files in place
+        filepaths = []
         for filepath in args.files:
-            if not Path(filepath).exists():
+            if not os.path.exists(filepath):
                 print(f"Error: File not found: {filepath}", file=sys.stderr)
                 continue
-            fix_file(filepath, args.compress, args.suffix, weight_format)
+            filepaths.append(filepath)
+
+        durable = args.durable != "off"
+        fix_args = [
+            (filepath, args.compress, args.suffix, weight_format, durable)
+            for filepath in filepaths
+        ]
+        if args.jobs > 1 and len(filepaths) > 1:
+            # Files are independent, each one is written to its own temporary file
+            with multiprocessing.Pool(min(args.jobs, len(filepaths))) as pool:
+                fixed = pool.starmap(fix_file, fix_args)
+        else:
+            fixed = [fix_file(*fix_arg) for fix_arg in fix_args]
+
+        if args.durable == "dir":
+            # Sync each directory once, after all of its files have been replaced
+            for directory in {
+                os.path.dirname(filepath) or "."
+                for filepath, replaced in zip(filepaths, fixed, strict=True)
+                if replaced
+            }:
+                _sync_directory(directory)
 
 
 if __name__ == "__main__":
@@ -7,17 +7,24 @@ including number of events, process information, particle combinations, etc.
 """
 
 import argparse
+import functools
+import multiprocessing
+import os
+import stat
 import sys
 import warnings
-from collections import Counter
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from pathlib import Path
+from operator import attrgetter
 from typing import Any, TextIO
 
 import pylhe
 from typing_extensions import Self
 
-from lheutils.cli.util import create_base_parser
+from lheutils.cli.util import add_jobs_argument, create_base_parser, read_lhe_file
+
+ChannelKey = tuple[tuple[int, ...], tuple[int, ...]]
 
 
 @dataclass
@@ -30,25 +37,37 @@ class LHEChannel:
     num_negative_events: int
     num_zero_events: int
 
+    @functools.cached_property
+    def key(self) -> ChannelKey:
+        """Sorted incoming and outgoing PDG IDs identifying the channel, computed once."""
+        return (
+            tuple(sorted(self.incoming_pdgid)),
+            tuple(sorted(self.outgoing_pdgid)),
+        )
+
+
+def _add_channel(merged: dict[ChannelKey, LHEChannel], channel: LHEChannel) -> None:
+    """Add the counts of a channel to its entry in ``merged``, creating it if needed."""
+    key = channel.key
+    if key not in merged:
+        merged[key] = LHEChannel(
+            incoming_pdgid=channel.incoming_pdgid,
+            outgoing_pdgid=channel.outgoing_pdgid,
+            num_events=0,
+            num_negative_events=0,
+            num_zero_events=0,
+        )
+        # Hand the key on to the merged copy, so it is not sorted again
+        merged[key].__dict__["key"] = key
+    merged[key].num_events += channel.num_events
+    merged[key].num_negative_events += channel.num_negative_events
+    merged[key].num_zero_events += channel.num_zero_events
+
 
 def merge_channels(channels: list[LHEChannel]) -> list[LHEChannel]:
-    merged: dict[tuple[tuple[int, ...], tuple[int, ...]], LHEChannel] = {}
+    merged: dict[ChannelKey, LHEChannel] = {}
     for channel in channels:
-        key = (
-            tuple(sorted(channel.incoming_pdgid)),
-            tuple(sorted(channel.outgoing_pdgid)),
-        )
-        if key not in merged:
-            merged[key] = LHEChannel(
-                incoming_pdgid=channel.incoming_pdgid,
-                outgoing_pdgid=channel.outgoing_pdgid,
-                num_events=0,
-                num_negative_events=0,
-                num_zero_events=0,
-            )
-        merged[key].num_events += channel.num_events
-        merged[key].num_negative_events += channel.num_negative_events
-        merged[key].num_zero_events += channel.num_zero_events
+        _add_channel(merged, channel)
     return list(merged.values())
 
 
@@ -62,34 +81,52 @@ class LHEProcess:
     channels: list[LHEChannel]
 
 
-@dataclass
+@dataclass(init=False)
 class LHEAccumulatedInfo:
     total_events: int
     total_negative_weighted_events: int
     total_zero_weighted_events: int
-    total_channels: list[LHEChannel]
+    # Merged channels by key, the only store of the accumulated channels
+    _channels_by_key: dict[ChannelKey, LHEChannel]
+
+    def __init__(
+        self,
+        total_events: int,
+        total_negative_weighted_events: int,
+        total_zero_weighted_events: int,
+        total_channels: Iterable[LHEChannel] = (),
+    ) -> None:
+        self.total_events = total_events
+        self.total_negative_weighted_events = total_negative_weighted_events
+        self.total_zero_weighted_events = total_zero_weighted_events
+        self._channels_by_key = {}
+        for channel in total_channels:
+            _add_channel(self._channels_by_key, channel)
+
+    @property
+    def total_channels(self) -> list[LHEChannel]:
+        """Merged channels in the order they were first seen."""
+        return list(self._channels_by_key.values())
 
     def __add__(self, other: "LHEAccumulatedInfo") -> "LHEAccumulatedInfo":
-        return LHEAccumulatedInfo(
-            total_events=self.total_events + other.total_events,
-            total_negative_weighted_events=(
-                self.total_negative_weighted_events
-                + other.total_negative_weighted_events
-            ),
-            total_zero_weighted_events=(
-                self.total_zero_weighted_events + other.total_zero_weighted_events
-            ),
-            total_channels=merge_channels(self.total_channels + other.total_channels),
+        result = LHEAccumulatedInfo(
+            total_events=self.total_events,
+            total_negative_weighted_events=self.total_negative_weighted_events,
+            total_zero_weighted_events=self.total_zero_weighted_events,
+            total_channels=self._channels_by_key.values(),
         )
+        result += other
+        return result
 
     def __iadd__(self, other: "LHEAccumulatedInfo") -> Self:
         self.total_events += other.total_events
         self.total_negative_weighted_events += other.total_negative_weighted_events
         self.total_zero_weighted_events += other.total_zero_weighted_events
-        self.total_channels = merge_channels(self.total_channels + other.total_channels)
+        for channel in other._channels_by_key.values():
+            _add_channel(self._channels_by_key, channel)
         return self
 
-    def print(self, *args: Any, **kwargs: Any) -> None:
+    def print(self, *args: Any, sort: bool = True, **kwargs: Any) -> None:
         print("=" * 60)
         negative_ratio = (
             self.total_negative_weighted_events / self.total_events
@@ -101,13 +138,14 @@ class LHEAccumulatedInfo:
             if self.total_events > 0
             else 0.0
         )
-        print(
-            f"Total number of events: {self.total_events} (negative: {negative_ratio:.2%}, zero: {zero_ratio:.2%})",
-            *args,
-            **kwargs,
-        )
-        sorted_channels = sorted(
-            self.total_channels, key=lambda ch: ch.num_events, reverse=True
+        # Collect the lines and print them at once
+        lines = [
+            f"Total number of events: {self.total_events} (negative: {negative_ratio:.2%}, zero: {zero_ratio:.2%})"
+        ]
+        sorted_channels = (
+            sorted(self.total_channels, key=attrgetter("num_events"), reverse=True)
+            if sort
+            else self.total_channels
         )
         for channel in sorted_channels:
             percentage = (
@@ -125,13 +163,12 @@ class LHEAccumulatedInfo:
                 if channel.num_events > 0
                 else 0.0
             )
-            print(
+            lines.append(
                 f"{channel.incoming_pdgid} -> {channel.outgoing_pdgid}: "
                 f"{channel.num_events:,} events ({percentage:.1f}%, "
-                f"negative: {negative_ratio:.2%}, zero: {zero_ratio:.2%})",
-                *args,
-                **kwargs,
+                f"negative: {negative_ratio:.2%}, zero: {zero_ratio:.2%})"
             )
+        print("\n".join(lines), *args, **kwargs)
         print("=" * 60)
 
 
@@ -168,20 +205,20 @@ class LHEInfo:
             self.zero_weighted_events / self.num_events if self.num_events > 0 else 0.0
         )
 
-    def print(self) -> LHEAccumulatedInfo:
-        print("-" * 60)
-        print(f"File: {self.filepath}")
+    def print(self, sort: bool = True) -> LHEAccumulatedInfo:
+        # Collect the lines and print them at once
+        lines = ["-" * 60, f"File: {self.filepath}"]
 
         # Beam information
-        print(f"Beam A: {self.beamA} (PDF: {self.pdfA}) @ {self.energyA} GeV")
-        print(f"Beam B: {self.beamB} (PDF: {self.pdfB}) @ {self.energyB} GeV")
+        lines.append(f"Beam A: {self.beamA} (PDF: {self.pdfA}) @ {self.energyA} GeV")
+        lines.append(f"Beam B: {self.beamB} (PDF: {self.pdfB}) @ {self.energyB} GeV")
         # Weight groups
         if self.weight_groups:
-            print("  Weight Groups:")
+            lines.append("  Weight Groups:")
             for name, count in self.weight_groups.items():
-                print(f"    {name}: {count} weights")
+                lines.append(f"    {name}: {count} weights")
         # Number of events
-        print(
+        lines.append(
             f"Number of events: {self.num_events} (negative: {self.negative_weighted_events_ratio:.2%}, zero: {self.zero_weighted_events_ratio:.2%})"
         )
 
@@ -189,15 +226,17 @@ class LHEInfo:
         processes = self.process_info
         if processes:
             for proc in processes:
-                print(
+                lines.append(
                     f"Process {proc.procId} cross-section: ({proc.xSection:.3e} +- {proc.error:.3e}) pb"
                 )
 
                 channels = proc.channels
                 if channels:
                     # Sort channels by num_events in descending order
-                    sorted_channels = sorted(
-                        channels, key=lambda ch: ch.num_events, reverse=True
+                    sorted_channels = (
+                        sorted(channels, key=attrgetter("num_events"), reverse=True)
+                        if sort
+                        else channels
                     )
                     for channel in sorted_channels:
                         percentage = (
@@ -215,17 +254,18 @@ class LHEInfo:
                             if channel.num_events > 0
                             else 0.0
                         )
-                        print(
+                        lines.append(
                             f"  {channel.incoming_pdgid} -> {channel.outgoing_pdgid}: {channel.num_events:,} events ({percentage:.1f}%, negative: {negative_ratio:.2%}, zero: {zero_ratio:.2%})"
                         )
+        print("\n".join(lines))
 
         return LHEAccumulatedInfo(
             total_events=self.num_events,
             total_negative_weighted_events=self.negative_weighted_events,
             total_zero_weighted_events=self.zero_weighted_events,
-            total_channels=merge_channels(
-                [channel for pi in self.process_info for channel in pi.channels]
-            ),
+            total_channels=[
+                channel for pi in self.process_info for channel in pi.channels
+            ],
         )
 
 
@@ -256,56 +296,57 @@ def get_weight_groups(lhefile: pylhe.LHEFile) -> dict[str, int]:
 def get_lheinfo(filepath_or_fileobj: str | TextIO, channels: bool = False) -> LHEInfo:
     # Read LHE file
     if isinstance(filepath_or_fileobj, str):
-        lhefile = pylhe.LHEFile.fromfile(filepath_or_fileobj)
+        lhefile = read_lhe_file(filepath_or_fileobj)
         file_display_name = filepath_or_fileobj
     else:
         lhefile = pylhe.LHEFile.frombuffer(filepath_or_fileobj)
         file_display_name = "<stdin>"
     init_info = lhefile.init.initInfo
 
-    initial_final_combinations: Counter[
-        tuple[int, tuple[int, ...], tuple[int, ...]]
-    ] = Counter()
-
-    initial_final_negative_combinations: Counter[
-        tuple[int, tuple[int, ...], tuple[int, ...]]
-    ] = Counter()
-    initial_final_zero_combinations: Counter[
-        tuple[int, tuple[int, ...], tuple[int, ...]]
-    ] = Counter()
+    # Event counts per (process ID, incoming, outgoing) channel, as
+    # [all events, negative weighted events, zero weighted events]
+    channel_counts: defaultdict[
+        tuple[int, tuple[int, ...], tuple[int, ...]], list[int]
+    ] = defaultdict(lambda: [0, 0, 0])
 
     num_events = 0
     num_negative_weighted_events = 0
     num_zero_weighted_events = 0
     for event in lhefile.events:
+        weight = event.eventinfo.weight
         num_events += 1
-        if event.eventinfo.weight < 0:
+        if weight < 0:
             num_negative_weighted_events += 1
-        if event.eventinfo.weight == 0:
+        if weight == 0:
             num_zero_weighted_events += 1
         if channels:
-            initial = []
-            final = []
-
-            for particle in event.particles:
-                if particle.status == -1:  # Incoming particles
-                    initial.append(particle.id)
-                elif particle.status == 1:  # Outgoing particles
-                    final.append(particle.id)
-
-            # Count initial particles
-            initial_tuple = tuple(sorted(initial))
-
-            # Count final particles
-            final_tuple = tuple(sorted(final))
-
-            # Count initial -> final combinations
-            combination = (event.eventinfo.pid, initial_tuple, final_tuple)
-            initial_final_combinations[combination] += 1
-            if event.eventinfo.weight < 0:
-                initial_final_negative_combinations[combination] += 1
-            if event.eventinfo.weight == 0:
-                initial_final_zero_combinations[combination] += 1
+            particles = event.particles
+            # Incoming (status -1) and outgoing (status 1) particles
+            initial = sorted([p.id for p in particles if p.status == -1])
+            final = sorted([p.id for p in particles if p.status == 1])
+
+            counts = channel_counts[(event.eventinfo.pid, tuple(initial), tuple(final))]
+            counts[0] += 1
+            if weight < 0:
+                counts[1] += 1
+            if weight == 0:
+                counts[2] += 1
+
+    pid_to_channels: dict[int, list[LHEChannel]] = {}
+    for (pid, incoming_pdgid, outgoing_pdgid), (
+        count,
+        negative_count,
+        zero_count,
+    ) in channel_counts.items():
+        pid_to_channels.setdefault(pid, []).append(
+            LHEChannel(
+                incoming_pdgid=list(incoming_pdgid),
+                outgoing_pdgid=list(outgoing_pdgid),
+                num_events=count,
+                num_negative_events=negative_count,
+                num_zero_events=zero_count,
+            )
+        )
 
     return LHEInfo(
         filepath=file_display_name,
@@ -324,34 +365,32 @@ def get_lheinfo(filepath_or_fileobj: str | TextIO, channels: bool = False) -> LH
                 procId=proc.procId,
                 xSection=proc.xSection,
                 error=proc.error,
-                channels=[
-                    LHEChannel(
-                        incoming_pdgid=list(incoming_pdgid),
-                        outgoing_pdgid=list(outgoing_pdgid),
-                        num_events=count,
-                        num_negative_events=initial_final_negative_combinations.get(
-                            (pid, incoming_pdgid, outgoing_pdgid), 0
-                        ),
-                        num_zero_events=initial_final_zero_combinations.get(
-                            (pid, incoming_pdgid, outgoing_pdgid), 0
-                        ),
-                    )
-                    for (
-                        pid,
-                        incoming_pdgid,
-                        outgoing_pdgid,
-                    ), count in initial_final_combinations.items()
-                    if pid == proc.procId
-                ],
+                channels=pid_to_channels.get(proc.procId, []),
             )
             for proc in lhefile.init.procInfo
         ],
     )
 
 
+def _iter_lheinfos(
+    filepaths_or_fileobjs: list[str | TextIO],
+    channels: bool = False,
+    jobs: int = 1,
+) -> Iterator[LHEInfo]:
+    """Yield the info of each input in order, analyzing files in parallel if requested."""
+    lheinfo = functools.partial(get_lheinfo, channels=channels)
+    if jobs > 1 and len(filepaths_or_fileobjs) > 1:
+        with multiprocessing.Pool(min(jobs, len(filepaths_or_fileobjs))) as pool:
+            yield from pool.imap(lheinfo, filepaths_or_fileobjs)
+    else:
+        yield from map(lheinfo, filepaths_or_fileobjs)
+
+
 def get_lhesummary(
     filepaths_or_fileobjs: list[str | TextIO],
     channels: bool = False,
+    jobs: int = 1,
+    sort: bool = True,
 ) -> LHEAccumulatedInfo:
     lheacc = LHEAccumulatedInfo(
         total_events=0,
@@ -360,9 +399,8 @@ def get_lhesummary(
         total_channels=[],
     )
     # Analyze all files
-    for filepath_or_fileobj in filepaths_or_fileobjs:
-        lheinfo = get_lheinfo(filepath_or_fileobj, channels=channels)
-        lheacc += lheinfo.print()
+    for lheinfo in _iter_lheinfos(filepaths_or_fileobjs, channels=channels, jobs=jobs):
+        lheacc += lheinfo.print(sort=sort)
 
     return lheacc
 
@@ -377,6 +415,8 @@ Examples:
   lheinfo file.lhe                      # Analyze single file (plain format)
   cat file.lhe | lheinfo                # Read from stdin
   lheinfo *.lhe                         # Analyze multiple files
+  lheinfo -j 8 *.lhe                    # Analyze 8 files at a time
+  lheinfo --no-sort *.lhe               # Keep channels in order of appearance
         """,
     )
 
@@ -391,6 +431,16 @@ Examples:
         default=True,
         help="Do not display channel information (use --no-channels to override)",
     )
+    parser.add_argument(
+        "--sort",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Sort channels by number of events (use --no-sort to keep them in order of appearance)",
+    )
+    add_jobs_argument(
+        parser,
+        help_text="Number of files to analyze in parallel worker processes (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -404,19 +454,24 @@ Examples:
     else:
         # Expand file paths
         for pattern in args.files:
-            path = Path(pattern)
-            if path.exists():
-                if path.is_file():
-                    file_inputs.append(str(path))
-                else:
-                    warnings.warn(f"{pattern} is not a file", UserWarning, stacklevel=2)
+            # A single stat call per path, paths that cannot be stat'ed are skipped
+            try:
+                mode = os.stat(pattern).st_mode
+            except OSError:
+                continue
+            if stat.S_ISREG(mode):
+                file_inputs.append(pattern)
+            else:
+                warnings.warn(f"{pattern} is not a file", UserWarning, stacklevel=2)
         if not file_inputs:
             print("Error: No valid files found and no stdin data", file=sys.stderr)
             sys.exit(1)
 
-    acc = get_lhesummary(file_inputs, channels=args.channels)
+    acc = get_lhesummary(
+        file_inputs, channels=args.channels, jobs=args.jobs, sort=args.sort
+    )
     if len(file_inputs) > 1:
-        acc.print()
+        acc.print(sort=args.sort)
 
 
 if __name__ == "__main__":
@@ -8,10 +8,10 @@ This ensures the merged file maintains physical consistency.
 """
 
 import argparse
+import os
 import sys
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable
 from copy import deepcopy
-from pathlib import Path
 
 import pylhe
 
@@ -19,7 +19,9 @@ from lheutils.cli.util import (
     add_weight_format_argument,
     create_base_parser,
     create_output_format,
+    open_lhe_output,
     parse_weight_format,
+    read_lhe_file,
 )
 
 
@@ -80,21 +82,27 @@ def merge_lhe_files(
         output_file: Path to the output LHE file (None for stdout)
         weight_format: How to serialize event weights in output
     """
-    # Read all input files and their initialization sections
-    lhefiles = []
+    # Read only the initialization sections, one file open at a time
     init_sections = []
-    total_events = 0
+    headers = []
+    reference: pylhe.LHEFile | None = None
 
     for input_file in input_files:
         try:
-            lhefile = pylhe.LHEFile.fromfile(input_file)
-
-            lhefiles.append(lhefile)
-            init_sections.append(lhefile.init)
-
+            lhefile = read_lhe_file(input_file)
         except Exception as e:
             return 1, f"Error reading input file '{input_file}': {e}"
 
+        # The events are read again while merging, close the file for now
+        if isinstance(lhefile.events, Generator):
+            lhefile.events.close()
+        init_sections.append(lhefile.init)
+        headers.append(lhefile.header)
+        if reference is None:
+            reference = lhefile
+    if reference is None:
+        return 1, "Error: No input files to merge"
+
     # Check that all initialization sections are identical
     if not check_init_compatibility(init_sections):
         return (
@@ -102,9 +110,7 @@ def merge_lhe_files(
             """Error: Input files have different initialization sections.
         All files must have identical <init> blocks to be merged.""",
         )
-    if not check_header_initrwgt_compatibility(
-        [lhefile.header for lhefile in lhefiles]
-    ):
+    if not check_header_initrwgt_compatibility(headers):
         return (
             1,
             """Error: Input files have different initrwgt header sections.
@@ -117,30 +123,32 @@ def merge_lhe_files(
     def merged_events() -> Iterable[pylhe.LHEEvent]:
         """Generator that yields events from all input files in sequence."""
         nonlocal total_events
-        for lhefile in lhefiles:
-            for event in lhefile.events:
+        for input_file in input_files:
+            for event in read_lhe_file(input_file).events:
                 total_events += 1
                 yield event
 
     # Create output file
     merged_file = pylhe.LHEFile(
-        init=lhefiles[0].init,
+        init=reference.init,
         events=merged_events(),
-        header=deepcopy(lhefiles[0].header),
-        comment=lhefiles[0].comment,
-        version=lhefiles[0].version,
-        extra_attributes=lhefiles[0].extra_attributes.copy(),
+        header=deepcopy(reference.header),
+        comment=reference.comment,
+        version=reference.version,
+        extra_attributes=reference.extra_attributes.copy(),
     )
-    lheformat = create_output_format(weight_format)
-
     # Write the merged file
     if output_file:
-        merged_file.tofile(output_file, lheformat=lheformat)
+        lheformat = create_output_format(
+            weight_format, compress=output_file.endswith((".gz", ".gzip"))
+        )
+        with open_lhe_output(output_file, lheformat) as output_stream:
+            merged_file.write(output_stream, lheformat=lheformat)
         return (
             0,
             f"Merged {len(input_files)} files into '{output_file}' with {total_events} total events.",
         )
-    merged_file.write(sys.stdout, lheformat=lheformat)
+    merged_file.write(sys.stdout, lheformat=create_output_format(weight_format))
     return (
         0,
         f"Merged {len(input_files)} files to stdout with {total_events} total events.",
@@ -185,11 +193,10 @@ Examples:
 
     # Check that all input files exist
     for input_file in args.input_files:
-        input_path = Path(input_file)
-        if not input_path.exists():
+        if not os.path.exists(input_file):
             print(f"Error: Input file '{input_file}' does not exist", file=sys.stderr)
             sys.exit(1)
-        if not input_path.is_file():
+        if not os.path.isfile(input_file):
             print(f"Error: '{input_file}' is not a file", file=sys.stderr)
             sys.exit(1)
 
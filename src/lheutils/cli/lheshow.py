@@ -7,16 +7,29 @@ from Les Houches Event (LHE) files.
 """
 
 import argparse
+import functools
+import io
+import multiprocessing
+import os
+import stat
 import sys
 import warnings
-from pathlib import Path
-from typing import TextIO
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack, closing, redirect_stderr, redirect_stdout
+from typing import Any, TextIO
 
 import pylhe
 
 from lheutils.cli.util import (
+    EVENTS_PER_CHUNK,
+    LHE_END_TAG,
+    add_jobs_argument,
+    buffered_stdout,
     create_base_parser,
+    is_hdf5_file,
+    iter_raw_lhe_blocks,
     lhapdf_name_and_id,
+    open_lhe_binary,
     pdg_name,
     pdg_name_and_id,
 )
@@ -184,6 +197,50 @@ def _format_output(
     return _format_init_pretty(block)
 
 
+def _find_event(
+    events: Iterable[pylhe.LHEEvent],
+    event_number: int,
+) -> tuple[pylhe.LHEEvent | None, int]:
+    """Return the event with the given 1-indexed number, or None and the number of events."""
+    i = 0
+    for i, event in enumerate(events, start=1):
+        if i == event_number:
+            return event, i
+    return None, i
+
+
+def _find_raw_event(
+    filepath: str,
+    event_number: int,
+) -> tuple[pylhe.LHEEvent | None, int]:
+    """Like ``_find_event``, but skip to the event by scanning raw bytes and parse only that event."""
+    with closing(iter_raw_lhe_blocks(open_lhe_binary(filepath))) as blocks:
+        prefix = next(blocks)
+        i = 0
+        for i, block in enumerate(blocks, start=1):
+            if i == event_number:
+                lhefile = pylhe.LHEFile.fromstring(
+                    (prefix + block).decode() + LHE_END_TAG
+                )
+                return next(iter(lhefile.events)), i
+    return None, i
+
+
+def _print_events(events: Iterable[pylhe.LHEEvent], output_format: str) -> None:
+    """Print events in the requested output format."""
+    for event in events:
+        print(_format_output(event, output_format))
+
+
+def _print_raw_events(blocks: list[bytes], prefix: str, output_format: str) -> None:
+    """Print raw event blocks, as stored for the lhe format and parsed together otherwise."""
+    if output_format == "lhe":
+        print(b"\n".join(blocks).decode())
+        return
+    lhefile = pylhe.LHEFile.fromstring(prefix + b"".join(blocks).decode() + LHE_END_TAG)
+    _print_events(lhefile.events, output_format)
+
+
 def show_event(
     filepath_or_fileobj: str | TextIO,
     event_number: int,
@@ -198,31 +255,34 @@ def show_event(
         output_format: Output format to display
         file_inputs_count: Number of total files being processed
     """
+    file_display_name = (
+        filepath_or_fileobj if isinstance(filepath_or_fileobj, str) else "<stdin>"
+    )
     try:
-        if isinstance(filepath_or_fileobj, str):
-            file_display_name = filepath_or_fileobj
-            lhefile = pylhe.LHEFile.fromfile(filepath_or_fileobj)
-        else:
-            file_display_name = "<stdin>"
-            lhefile = pylhe.LHEFile.frombuffer(filepath_or_fileobj)
-
-        target_index = event_number
-
-        if target_index < 0:
+        if event_number < 0:
             print(
                 f"Error: Event number must be positive (got {event_number})",
                 file=sys.stderr,
             )
             sys.exit(1)
 
-        # Iterate through events to find the target
-        i = 0
-        for i, event in enumerate(lhefile.events, start=1):
-            if i == target_index:
-                if file_inputs_count > 1:
-                    print(f"=== {file_display_name} ===")
-                print(_format_output(event, output_format))
-                return
+        # Only the target event of an XML file is parsed, the others are skipped as raw bytes
+        if not isinstance(filepath_or_fileobj, str):
+            event, i = _find_event(
+                pylhe.LHEFile.frombuffer(filepath_or_fileobj).events, event_number
+            )
+        elif is_hdf5_file(filepath_or_fileobj):
+            event, i = _find_event(
+                pylhe.LHEFile.fromfile(filepath_or_fileobj).events, event_number
+            )
+        else:
+            event, i = _find_raw_event(filepath_or_fileobj, event_number)
+
+        if event is not None:
+            if file_inputs_count > 1:
+                print(f"=== {file_display_name} ===")
+            print(_format_output(event, output_format))
+            return
 
         # If we get here, the event number was too high
         print(
@@ -239,6 +299,87 @@ def show_event(
         sys.exit(1)
 
 
+def show_events(
+    filepath_or_fileobj: str | TextIO,
+    event_range: tuple[int, int],
+    output_format: str = "pretty",
+    file_inputs_count: int = 1,
+) -> None:
+    """Show a range of events from an LHE file.
+
+    With the ``lhe`` output format, the event blocks of an XML file are
+    written as stored in the file, without being parsed at all. Events from
+    stdin or an HDF5 file are re-serialized by pylhe, like in ``show_event``.
+    Events are printed as they are read, so a range reaching past the last
+    event prints the events found before the error.
+
+    Args:
+        filepath_or_fileobj: Path to the LHE file or file object
+        event_range: First and last event number to display (1-indexed, inclusive)
+        output_format: Output format to display
+        file_inputs_count: Number of total files being processed
+    """
+    file_display_name = (
+        filepath_or_fileobj if isinstance(filepath_or_fileobj, str) else "<stdin>"
+    )
+    first, last = event_range
+    try:
+        with ExitStack() as stack:
+            items: Iterator[Any]
+            print_chunk: Callable[[list[Any]], None]
+            if not isinstance(filepath_or_fileobj, str):
+                items = iter(pylhe.LHEFile.frombuffer(filepath_or_fileobj).events)
+                print_chunk = functools.partial(
+                    _print_events, output_format=output_format
+                )
+            elif is_hdf5_file(filepath_or_fileobj):
+                items = iter(pylhe.LHEFile.fromfile(filepath_or_fileobj).events)
+                print_chunk = functools.partial(
+                    _print_events, output_format=output_format
+                )
+            else:
+                # Events before the range are skipped as raw bytes
+                items = stack.enter_context(
+                    closing(iter_raw_lhe_blocks(open_lhe_binary(filepath_or_fileobj)))
+                )
+                print_chunk = functools.partial(
+                    _print_raw_events,
+                    prefix=next(items).decode(),
+                    output_format=output_format,
+                )
+
+            # The range is printed chunk by chunk as it is read
+            i = 0
+            chunk: list[Any] = []
+            for i, item in enumerate(items, start=1):
+                if i < first:
+                    continue
+                if i == first and file_inputs_count > 1:
+                    print(f"=== {file_display_name} ===")
+                chunk.append(item)
+                if len(chunk) == EVENTS_PER_CHUNK or i == last:
+                    print_chunk(chunk)
+                    chunk = []
+                if i == last:
+                    return
+            if chunk:
+                print_chunk(chunk)
+
+        # If we get here, the range reaches past the last event
+        print(
+            f"Error: Events {first}-{last} not found in {file_display_name}. File has {i} events.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    except FileNotFoundError:
+        print(f"Error: File '{file_display_name}' not found", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading file '{file_display_name}': {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def show_init(
     filepath_or_fileobj: str | TextIO,
     output_format: str = "pretty",
@@ -271,6 +412,43 @@ def show_init(
         sys.exit(1)
 
 
+def _event_range(value: str) -> tuple[int, int]:
+    """Parse an ``A-B`` event range for argparse."""
+    try:
+        first, last = (int(part) for part in value.split("-", 1))
+    except ValueError:
+        msg = f"invalid event range '{value}', expected A-B"
+        raise argparse.ArgumentTypeError(msg) from None
+    if not 1 <= first <= last:
+        msg = f"invalid event range '{value}', expected 1 <= A <= B"
+        raise argparse.ArgumentTypeError(msg)
+    return first, last
+
+
+def _show_captured(
+    file_input: str,
+    event_number: int | None,
+    event_range: tuple[int, int] | None,
+    output_format: str,
+    file_inputs_count: int,
+) -> tuple[str, str, int]:
+    """Show events or the init block, returning the captured stdout, stderr and exit code."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            if event_number is not None:
+                show_event(file_input, event_number, output_format, file_inputs_count)
+            elif event_range is not None:
+                show_events(file_input, event_range, output_format, file_inputs_count)
+            else:
+                show_init(file_input, output_format, file_inputs_count)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+    return stdout.getvalue(), stderr.getvalue(), exit_code
+
+
 def main() -> None:
     """Main CLI function."""
     parser = create_base_parser(
@@ -281,6 +459,8 @@ Examples:
   lheshow file.lhe --event 45                # Pretty-print the 45th event
   lheshow file.lhe --init --format repr     # Show the init block as Python repr
   lheshow file.lhe.gz --event 1 --format lhe # Show first event in raw LHE/XML form
+  lheshow file.lhe --events 100-200 --format lhe # Copy events 100 to 200 as stored
+  lheshow *.lhe --init -j 8                  # Read 8 files at a time
         """,
     )
 
@@ -294,6 +474,15 @@ Examples:
     group.add_argument(
         "--event", type=int, metavar="N", help="Show the Nth event (1-indexed)"
     )
+    group.add_argument(
+        "--events",
+        type=_event_range,
+        metavar="A-B",
+        help=(
+            "Show events A to B (1-indexed, inclusive). With --format lhe, event "
+            "blocks of XML files are copied as stored instead of re-serialized"
+        ),
+    )
     group.add_argument("--init", action="store_true", help="Show the init block")
     parser.add_argument(
         "--format",
@@ -301,6 +490,10 @@ Examples:
         default="pretty",
         help="Display format to use: pretty (default), repr, or raw lhe/xml",
     )
+    add_jobs_argument(
+        parser,
+        help_text="Number of files to read in parallel worker processes (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -314,22 +507,46 @@ Examples:
     else:
         # Expand file paths
         for pattern in args.files:
-            path = Path(pattern)
-            if path.exists():
-                if path.is_file():
-                    file_inputs.append(str(path))
-                else:
-                    warnings.warn(f"{pattern} is not a file", UserWarning, stacklevel=2)
+            # A single stat call per path, paths that cannot be stat'ed are skipped
+            try:
+                mode = os.stat(pattern).st_mode
+            except OSError:
+                continue
+            if stat.S_ISREG(mode):
+                file_inputs.append(pattern)
+            else:
+                warnings.warn(f"{pattern} is not a file", UserWarning, stacklevel=2)
         if not file_inputs:
             print("Error: No valid files found and no stdin data", file=sys.stderr)
             sys.exit(1)
 
     # Execute the requested action
+    if args.jobs > 1 and len(file_inputs) > 1:
+        # Files are read in parallel, output is printed in the order of the inputs
+        show = functools.partial(
+            _show_captured,
+            event_number=args.event,
+            event_range=args.events,
+            output_format=args.format,
+            file_inputs_count=len(file_inputs),
+        )
+        with multiprocessing.Pool(min(args.jobs, len(file_inputs))) as pool:
+            for stdout, stderr, exit_code in pool.imap(show, file_inputs):
+                sys.stdout.write(stdout)
+                sys.stderr.write(stderr)
+                if exit_code != 0:
+                    sys.exit(exit_code)
+        return
+
     for file_input in file_inputs:
-        if args.event is not None:
-            show_event(file_input, args.event, args.format, len(file_inputs))
-        elif args.init:
-            show_init(file_input, args.format, len(file_inputs))
+        # The output of each file is written through a large buffer, flushed per file
+        with buffered_stdout() as output_stream, redirect_stdout(output_stream):
+            if args.event is not None:
+                show_event(file_input, args.event, args.format, len(file_inputs))
+            elif args.events is not None:
+                show_events(file_input, args.events, args.format, len(file_inputs))
+            elif args.init:
+                show_init(file_input, args.format, len(file_inputs))
 
 
 if __name__ == "__main__":
@@ -7,26 +7,86 @@ with approximately equal numbers of events distributed among them.
 """
 
 import argparse
+import os
 import sys
-from collections.abc import Iterable
 from copy import deepcopy
+from itertools import chain, islice
 from pathlib import Path
 
 import pylhe
 
 from lheutils.cli.util import (
+    DEFAULT_COMPRESSLEVEL,
+    LHE_END_TAG,
     add_weight_format_argument,
     create_base_parser,
     create_output_format,
+    detect_output_format,
+    is_hdf5_file,
+    iter_raw_lhe_blocks,
+    open_lhe_binary,
+    open_lhe_output,
     parse_weight_format,
 )
 
+# Number of raw event blocks joined into a single write
+EVENTS_PER_WRITE = 1000
+
+
+def _split_output_base(output_base: str) -> tuple[str, str]:
+    """Split the output base at the first dot of its file name into stem and suffix."""
+    head, name = os.path.split(output_base)
+    dot = name.find(".")
+    if dot == -1:
+        return output_base, ""
+    return os.path.join(head, name[:dot]), name[dot:]
+
+
+def _split_raw(
+    input_file: str,
+    output_base: str,
+    num_events: int,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+) -> tuple[int, str]:
+    """Split an XML LHE file by copying the raw event blocks, without parsing them."""
+    try:
+        blocks = iter_raw_lhe_blocks(
+            sys.stdin.buffer if input_file == "-" else open_lhe_binary(input_file)
+        )
+        prefix = next(blocks).decode()
+    except Exception as e:
+        source = "stdin" if input_file == "-" else f"file '{input_file}'"
+        return 1, f"Error reading input {source}: {e}"
+
+    stem, suffix = _split_output_base(output_base)
+    lheformat = create_output_format(
+        pylhe.LHEWeightFormat.RWGT,
+        compress=suffix.endswith((".gz", ".gzip")),
+        compresslevel=compresslevel,
+    )
+    i = 0
+    while (first_block := next(blocks, None)) is not None:
+        i += 1
+        output_filename = f"{stem}_{i}{suffix}"
+        events = chain([first_block], islice(blocks, num_events - 1))
+        with open_lhe_output(output_filename, lheformat) as f:
+            f.write(prefix)
+            # Event blocks are joined and written in batches, not one by one
+            while batch := list(islice(events, EVENTS_PER_WRITE)):
+                f.write((b"\n" + b"\n".join(batch)).decode())
+            f.write(f"\n{LHE_END_TAG}\n")
+    return (
+        0,
+        f"Split events into {i} files with base name '{output_base}'.",
+    )
+
 
 def split_lhe_file(
     input_file: str,
     output_base: str,
     num_events: int,
-    weight_format: pylhe.LHEWeightFormat = pylhe.LHEWeightFormat.RWGT,
+    weight_format: pylhe.LHEWeightFormat | None = None,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
 ) -> tuple[int, str]:
     """
     Split an LHE file into multiple output files.
@@ -35,42 +95,48 @@ def split_lhe_file(
         input_file: Path to the input LHE file
         output_base: Base name for output files including .lhe or .lhe.gz extension
         num_events: Number of events per output file
-        weight_format: How to serialize event weights in output
+        weight_format: How to serialize event weights in output (None copies the
+            event blocks of an XML file as they are)
+        compresslevel: Gzip compression level for .gz outputs
     """
     # Read the LHE file
     try:
-        if input_file == "-":
-            lhefile = pylhe.LHEFile.frombuffer(sys.stdin)
-            events_iter = iter(lhefile.events)
-        else:
-            lhefile = pylhe.LHEFile.fromfile(input_file)
-            events_iter = iter(lhefile.events)
+        raw_split = (
+            weight_format is None
+            and (input_file == "-" or not is_hdf5_file(input_file))
+            and isinstance(detect_output_format(output_base), pylhe.LHEXMLFormat)
+        )
+        if not raw_split:
+            if input_file == "-":
+                lhefile = pylhe.LHEFile.frombuffer(sys.stdin)
+                events_iter = iter(lhefile.events)
+            else:
+                lhefile = pylhe.LHEFile.fromfile(input_file)
+                events_iter = iter(lhefile.events)
     except Exception as e:
         source = "stdin" if input_file == "-" else f"file '{input_file}'"
         return 1, f"Error reading input {source}: {e}"
 
+    if raw_split:
+        # Nothing to re-serialize, cut the file at the event boundaries
+        return _split_raw(input_file, output_base, num_events, compresslevel)
+
     # events per file
     events_per_file = num_events
 
-    exhausted = False
-
-    def _generator() -> Iterable[pylhe.LHEEvent]:
-        nonlocal exhausted
-        for _ in range(events_per_file):
-            try:
-                yield next(events_iter)
-            except StopIteration:
-                exhausted = True
-                break
-
+    stem, suffix = _split_output_base(output_base)
     i = 0
-    lheformat = create_output_format(weight_format)
-    while not exhausted:
+    lheformat = create_output_format(
+        weight_format or pylhe.LHEWeightFormat.RWGT,
+        compress=suffix.endswith((".gz", ".gzip")),
+        compresslevel=compresslevel,
+    )
+    while (first_event := next(events_iter, None)) is not None:
         i += 1
-        output_filename = f"{output_base.replace('.', f'_{i}.', 1)}"
+        output_filename = f"{stem}_{i}{suffix}"
         new_file = pylhe.LHEFile(
             init=lhefile.init,
-            events=_generator(),
+            events=chain([first_event], islice(events_iter, events_per_file - 1)),
             header=deepcopy(lhefile.header),
             comment=lhefile.comment,
             version=lhefile.version,
@@ -117,9 +183,22 @@ Examples:
         help="Number of events per output file",
     )
 
+    parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESSLEVEL,
+        metavar="{0-9}",
+        help=(
+            "Gzip level for .gz outputs, lower is faster but larger "
+            f"(default: {DEFAULT_COMPRESSLEVEL}, like the other tools)"
+        ),
+    )
+
     add_weight_format_argument(
         parser,
-        help_text="Weight format to use in output files (default: rwgt)",
+        help_text="Weight format to use in output files (default: copy the events as they are)",
+        default=None,
     )
 
     args = parser.parse_args()
@@ -145,7 +224,12 @@ Examples:
         args.input,
         args.output,
         args.num_events,
-        weight_format=parse_weight_format(args.weight_format),
+        weight_format=(
+            None
+            if args.weight_format is None
+            else parse_weight_format(args.weight_format)
+        ),
+        compresslevel=args.compresslevel,
     )
 
     if code != 0:
@@ -1,26 +1,19 @@
 import argparse
+import functools
+import gzip
+import io
+import shutil
+import subprocess
+import sys
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, BinaryIO, Literal, TextIO
 
 import pylhe
-from particle import InvalidParticle, Particle, ParticleNotFound
 
 import lheutils
 
-try:
-    import lhapdf  # type: ignore[import-not-found]
-
-    LHAPDF_BASE_PATHS = lhapdf.paths()
-except ImportError:
-    LHAPDF_BASE_PATHS = [
-        "/usr/share/lhapdf",
-        "/usr/local/share/lhapdf",
-        "/opt/local/share/lhapdf",
-        "/opt/share/lhapdf",
-        str(Path.home() / ".local/share/lhapdf"),
-        str(Path.home() / ".lhapdf"),
-    ]
-
 WEIGHT_FORMAT_CHOICES = tuple(
     weight_format.value for weight_format in pylhe.LHEWeightFormat
 )
@@ -61,10 +54,60 @@ OUTPUT_FORMAT_PRESETS: dict[LHEOutputFormatName, None | pylhe.LHEOutputFormat] =
     "hdf5-gz": pylhe.HDF5_GZ_FORMAT,
 }
 
+# Gzip level shared by all tools writing compressed output
+DEFAULT_COMPRESSLEVEL = pylhe.DEFAULT_FORMAT.compresslevel
+
+# Text shown by --version, built once
+_VERSION = f"%(prog)s {lheutils.__version__} using pylhe {pylhe.__version__}"
+
+# Read size used when scanning raw LHE bytes for event blocks
+RAW_CHUNK_SIZE = 1 << 20
+# Buffer size for reading and writing LHE streams, far above the 8 KiB default
+IO_BUFFER_SIZE = 4 << 20
+# Number of events parsed, printed or handed to a worker process at once
+EVENTS_PER_CHUNK = 500
+
+# Closing tag appended to a raw prefix and event blocks to parse them as a document
+LHE_END_TAG = "</LesHouchesEvents>"
+
+# HDF magic number per The HDF5 Field Guide II.A.
+_HDF5_MAGIC = b"\x89HDF\r\n\x1a\n"
+# GZIP magic number per RFC 1952 section 2.3.1
+_GZIP_MAGIC = b"\x1f\x8b"
+_INIT_END_TAG = b"</init>"
+_EVENT_START_TAG = b"<event"
+_EVENT_END_TAG = b"</event>"
+
+
+@functools.cache
+def lhapdf_base_paths() -> list[str]:
+    """Return the LHAPDF data directories, importing lhapdf only on first use."""
+    try:
+        import lhapdf  # type: ignore[import-not-found]  # noqa: PLC0415
+
+        return list(lhapdf.paths())
+    except ImportError:
+        return [
+            "/usr/share/lhapdf",
+            "/usr/local/share/lhapdf",
+            "/opt/local/share/lhapdf",
+            "/opt/share/lhapdf",
+            str(Path.home() / ".local/share/lhapdf"),
+            str(Path.home() / ".lhapdf"),
+        ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the former ``LHAPDF_BASE_PATHS`` constant on first access."""
+    if name == "LHAPDF_BASE_PATHS":
+        return lhapdf_base_paths()
+    err = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(err)
+
 
 def lhapdf_name(pdf_id: int) -> str:
 
-    for base in LHAPDF_BASE_PATHS:
+    for base in lhapdf_base_paths():
         index = Path(base) / "pdfsets.index"
         if not index.exists():
             continue
@@ -91,6 +134,9 @@ def lhapdf_name_and_id(pdf_id: int) -> str:
 
 
 def pdg_name(pdgid: int) -> str:
+    # particle loads its PDG tables on import, so only pay for it when names are shown
+    from particle import InvalidParticle, Particle, ParticleNotFound  # noqa: PLC0415
+
     try:
         return str(Particle.from_pdgid(pdgid).name)
     except (LookupError, InvalidParticle, ParticleNotFound):
@@ -105,14 +151,7 @@ def pdg_name_and_id(pdgid: int) -> str:
 def create_base_parser(**kwargs: Any) -> argparse.ArgumentParser:
     """Create a base argument parser with common options."""
     parser = argparse.ArgumentParser(**kwargs)
-    parser.add_argument(
-        "--version",
-        action="version",
-        version="%(prog)s "
-        + lheutils.__version__
-        + " using pylhe "
-        + pylhe.__version__,
-    )
+    parser.add_argument("--version", action="version", version=_VERSION)
     return parser
 
 
@@ -120,12 +159,13 @@ def add_weight_format_argument(
     parser: argparse.ArgumentParser,
     *flags: str,
     help_text: str = "Weight format to use in output (default: rwgt)",
+    default: str | None = pylhe.LHEWeightFormat.RWGT.value,
 ) -> None:
     """Add the shared weight-format CLI argument."""
     parser.add_argument(
         *(flags or ("--weight-format",)),
         choices=WEIGHT_FORMAT_CHOICES,
-        default=pylhe.LHEWeightFormat.RWGT.value,
+        default=default,
         help=help_text,
     )
 
@@ -165,12 +205,236 @@ def parse_output_format(
     return OUTPUT_FORMAT_PRESETS[output_format]
 
 
+def detect_output_format(filepath: str) -> pylhe.LHEOutputFormat:
+    """Pick the pylhe output preset from a file suffix, like ``LHEFile.tofile``."""
+    if filepath.endswith((".h5", ".hdf5", "lheh5")):
+        return pylhe.HDF5_FORMAT
+    if filepath.endswith((".gz", ".gzip")):
+        return pylhe.GZ_FORMAT
+    return pylhe.DEFAULT_FORMAT
+
+
 def create_output_format(
     weight_format: pylhe.LHEWeightFormat,
     compress: bool = False,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
 ) -> pylhe.LHEXMLFormat:
     """Build an XML pylhe output-format object for writers."""
     return pylhe.LHEXMLFormat(
         weights=weight_format,
         compress=compress,
+        compresslevel=compresslevel,
     )
+
+
+def positive_int(value: str) -> int:
+    """Custom argparse type for integers of at least 1."""
+    try:
+        ivalue = int(value)
+    except ValueError:
+        err = f"Invalid integer value: '{value}'"
+        raise argparse.ArgumentTypeError(err) from None
+
+    if ivalue < 1:
+        err = f"Value must be at least 1, got: {ivalue}"
+        raise argparse.ArgumentTypeError(err)
+
+    return ivalue
+
+
+def add_jobs_argument(
+    parser: argparse.ArgumentParser,
+    help_text: str = "Number of worker processes to use (default: 1)",
+) -> None:
+    """Add the shared worker-process CLI argument."""
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        default=1,
+        help=help_text,
+    )
+
+
+class _BufferedGzipFile(gzip.GzipFile):
+    """A ``gzip.GzipFile`` that also closes the buffered file it decompresses."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        super().__init__(fileobj=raw, mode="rb")
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._raw.close()
+
+
+def open_lhe_binary(filepath: str) -> BinaryIO | gzip.GzipFile:
+    """Open an LHE file for binary reading, transparently decompressing gzip.
+
+    Compressed input is read through the same large buffer as plain input.
+    """
+    raw = open(filepath, "rb", buffering=IO_BUFFER_SIZE)
+    is_gzip = raw.read(len(_GZIP_MAGIC)) == _GZIP_MAGIC
+    raw.seek(0)
+    if is_gzip:
+        return _BufferedGzipFile(raw)
+    return raw
+
+
+def open_stdin() -> BinaryIO | TextIO:
+    """Open stdin for binary reading through a large buffer.
+
+    Falls back to ``sys.stdin`` itself if it is not backed by a file descriptor.
+    """
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return sys.stdin
+    return open(fd, "rb", buffering=IO_BUFFER_SIZE, closefd=False)
+
+
+@contextmanager
+def buffered_stdout() -> Iterator[TextIO]:
+    """Write text to stdout through a large buffer that is flushed on exit.
+
+    Falls back to ``sys.stdout`` itself if it is not backed by a file descriptor.
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        yield sys.stdout
+        return
+    sys.stdout.flush()
+    with io.TextIOWrapper(
+        io.BufferedWriter(io.FileIO(fd, "w", closefd=False), IO_BUFFER_SIZE),
+        encoding=sys.stdout.encoding,
+    ) as stream:
+        yield stream
+
+
+@contextmanager
+def open_lhe_output(filepath: str, lheformat: pylhe.LHEXMLFormat) -> Iterator[TextIO]:
+    """Open an XML LHE output file for writing text.
+
+    Compressed output is piped through ``pigz`` when it is on the ``PATH``, which
+    deflates on all cores, and falls back to the single-threaded gzip module.
+    Events are written as they are produced, through a large write buffer.
+    """
+    if not lheformat.compress:
+        with open(filepath, "w", buffering=IO_BUFFER_SIZE) as f:
+            yield f
+        return
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        # Large writes give zlib bigger blocks to deflate at once
+        with io.TextIOWrapper(
+            io.BufferedWriter(
+                gzip.GzipFile(filepath, "wb", compresslevel=lheformat.compresslevel),
+                IO_BUFFER_SIZE,
+            )
+        ) as f:
+            yield f
+        return
+    with (
+        open(filepath, "wb") as raw,
+        subprocess.Popen(
+            [pigz, f"-{lheformat.compresslevel}", "-c"],
+            bufsize=IO_BUFFER_SIZE,
+            stdin=subprocess.PIPE,
+            stdout=raw,
+        ) as process,
+    ):
+        if process.stdin is None:
+            err = "Unable to open pipe to pigz"
+            raise OSError(err)
+        with io.TextIOWrapper(process.stdin) as f:
+            yield f
+    if process.returncode != 0:
+        err = f"pigz exited with status {process.returncode}"
+        raise OSError(err)
+
+
+def is_hdf5_file(filepath: str) -> bool:
+    """Check for the HDF5 signature without importing h5py."""
+    with open(filepath, "rb") as f:
+        return f.read(len(_HDF5_MAGIC)) == _HDF5_MAGIC
+
+
+def detect_input_format(filepath: str) -> pylhe.LHEOutputFormat:
+    """Pick the pylhe output preset matching how an existing file is stored."""
+    with open(filepath, "rb") as f:
+        magic = f.read(len(_HDF5_MAGIC))
+    if magic == _HDF5_MAGIC:
+        return pylhe.HDF5_FORMAT
+    if magic.startswith(_GZIP_MAGIC):
+        return pylhe.GZ_FORMAT
+    return pylhe.DEFAULT_FORMAT
+
+
+def read_lhe_file(filepath: str) -> pylhe.LHEFile:
+    """Read an LHE file like ``pylhe.LHEFile.fromfile``, but with a large read buffer."""
+    if is_hdf5_file(filepath):
+        return pylhe.LHEFile.fromfile(filepath)
+    return pylhe.LHEFile.frombuffer(open_lhe_binary(filepath))
+
+
+def _find_event_start(buffer: bytes, pos: int) -> int:
+    """Find the next ``<event`` tag, skipping longer tags like ``<eventgroup>``."""
+    start = buffer.find(_EVENT_START_TAG, pos)
+    while start != -1:
+        following = buffer[
+            start + len(_EVENT_START_TAG) : start + len(_EVENT_START_TAG) + 1
+        ]
+        if not following:
+            # Tag is cut at the end of the buffer, wait for more data
+            return -1
+        if following == b">" or following.isspace():
+            return start
+        start = buffer.find(_EVENT_START_TAG, start + 1)
+    return -1
+
+
+def iter_raw_lhe_blocks(
+    fileobj: BinaryIO | gzip.GzipFile,
+    chunk_size: int = RAW_CHUNK_SIZE,
+) -> Generator[bytes, None, None]:
+    """Yield the raw bytes up to ``</init>`` first, then every raw event block.
+
+    Only byte-level scanning is done here, no XML parsing, so this is much
+    cheaper than iterating ``pylhe.LHEFile.events`` when event blocks are only
+    copied or handed on. Like pylhe, the file object is closed once the
+    generator is exhausted or discarded.
+    """
+    with fileobj:
+        buffer = b""
+        init_end = -1
+        while init_end == -1:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                err = "No <init> block found in the LHE file."
+                raise ValueError(err)
+            search_from = max(0, len(buffer) - len(_INIT_END_TAG))
+            buffer += chunk
+            init_end = buffer.find(_INIT_END_TAG, search_from)
+
+        pos = init_end + len(_INIT_END_TAG)
+        yield buffer[:pos]
+
+        while True:
+            start = _find_event_start(buffer, pos)
+            end = buffer.find(_EVENT_END_TAG, start) if start != -1 else -1
+            if end != -1:
+                pos = end + len(_EVENT_END_TAG)
+                yield buffer[start:pos]
+                continue
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                return
+            # Keep the unfinished event block or a possibly cut start tag
+            keep = (
+                start if start != -1 else max(pos, len(buffer) - len(_EVENT_START_TAG))
+            )
+            buffer = buffer[keep:] + chunk
+            pos = 0
@@ -1,5 +1,9 @@
+import gzip
+import os
 import subprocess
+import sys
 
+import pylhe
 import skhep_testdata
 
 path = "./src/lheutils/cli/"
@@ -68,3 +72,78 @@ def test_lhe2lhe_lhe2lhe_same():
     # assert p1.returncode == 0
     assert p2.returncode == 0
     assert p3.returncode == 0
+
+
+def _write_lhe(path, num_events: int) -> str:
+    event = (
+        "<event>\n"
+        " 2 1 +1.0e+00 9.1e+01 7.5e-03 1.2e-01\n"
+        " 21 -1 0 0 501 502 0.0 0.0 4.5e+01 4.5e+01 0.0 0.0 9.0\n"
+        " 21 -1 0 0 502 501 0.0 0.0 -4.5e+01 4.5e+01 0.0 0.0 9.0\n"
+        "</event>\n"
+    )
+    path.write_text(
+        '<LesHouchesEvents version="3.0">\n<init>\n'
+        "2212 2212 6.5e+03 6.5e+03 0 0 247000 247000 -4 1\n"
+        "1.0e+01 1.0e-01 1.0e+00 1\n</init>\n"
+        + event * num_events
+        + "</LesHouchesEvents>\n"
+    )
+    return str(path)
+
+
+def _pigz_stub_env(tmp_path, body: str) -> dict[str, str]:
+    # A standalone script standing in for pigz, compressing with the gzip module
+    stub_dir = tmp_path / "bin"
+    stub_dir.mkdir()
+    stub = stub_dir / "pigz"
+    stub.write_text(
+        f"#!{sys.executable}\nimport gzip\nimport shutil\nimport sys\n\n{body}"
+    )
+    stub.chmod(0o755)
+    return {**os.environ, "PATH": f"{stub_dir}{os.pathsep}{os.environ['PATH']}"}
+
+
+def test_lhe2lhe_compresses_through_pigz(tmp_path):
+    input_file = _write_lhe(tmp_path / "input.lhe", 3)
+    output_file = tmp_path / "output.lhe.gz"
+    env = _pigz_stub_env(
+        tmp_path,
+        "level = int(sys.argv[1].lstrip('-'))\n"
+        "with gzip.GzipFile(fileobj=sys.stdout.buffer, mode='wb', compresslevel=level) as f:\n"
+        "    shutil.copyfileobj(sys.stdin.buffer, f)\n"
+        "open(__file__ + '.called', 'w').close()\n",
+    )
+
+    p = subprocess.run(
+        [f"{path}lhe2lhe.py", "-i", input_file, "-o", str(output_file)],
+        env=env,
+        check=False,
+    )
+
+    assert p.returncode == 0
+    assert (tmp_path / "bin" / "pigz.called").exists()
+    assert output_file.read_bytes()[:2] == b"\x1f\x8b"
+    with gzip.open(output_file, "rt") as f:
+        assert f.read().count("<event>") == 3
+    assert len(list(pylhe.LHEFile.fromfile(output_file).events)) == 3
+
+
+def test_lhe2lhe_fails_when_pigz_fails(tmp_path):
+    input_file = _write_lhe(tmp_path / "input.lhe", 3)
+    output_file = tmp_path / "output.lhe.gz"
+    env = _pigz_stub_env(
+        tmp_path,
+        "sys.stdin.buffer.read()\nsys.exit(3)\n",
+    )
+
+    p = subprocess.run(
+        [f"{path}lhe2lhe.py", "-i", input_file, "-o", str(output_file)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert p.returncode == 1
+    assert "pigz exited with status 3" in p.stderr
@@ -167,3 +167,36 @@ def test_convert_lhe_file_rejects_non_plain_stdout(output_format):
 
     assert retcode == 1
     assert message == "Error: Stdout only supports uncompressed XML output formats"
+
+
+def test_convert_lhe_file_jobs_matches_serial_output(tmp_path):
+    input_file = skhep_testdata.data_path("pylhe-testlhef3.lhe")
+    serial_file = tmp_path / "serial.lhe"
+    parallel_file = tmp_path / "parallel.lhe"
+
+    for output_file, jobs in ((serial_file, 1), (parallel_file, 2)):
+        retcode, message = convert_lhe_file(
+            input_file,
+            str(output_file),
+            output_format=pylhe.WEIGHTS_FORMAT,
+            append_lhe_weight=("newgroup", "9003", "copied central weight"),
+            jobs=jobs,
+        )
+        assert retcode == 0
+        assert message == "Conversion successful"
+
+    assert parallel_file.read_text() == serial_file.read_text()
+
+
+def test_convert_lhe_file_without_changes_copies_input(tmp_path):
+    input_file = skhep_testdata.data_path(
+        "pylhe-testfile-madgraph-2.2.1-Z-ckkwl.lhe.gz"
+    )
+    output_file = tmp_path / "copy.lhe.gz"
+
+    retcode, message = convert_lhe_file(input_file, str(output_file))
+
+    assert retcode == 0
+    assert message == "Conversion successful"
+    with open(input_file, "rb") as f:
+        assert output_file.read_bytes() == f.read()
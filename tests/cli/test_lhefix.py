@@ -4,7 +4,8 @@ from pathlib import Path
 import pylhe
 import skhep_testdata
 
-from lheutils.cli.lhefix import fix_file
+from lheutils.cli import lhefix
+from lheutils.cli.lhefix import fix_file, main
 
 
 def test_fix_file_preserves_initrwgt_header_when_writing_file(tmp_path, capsys):
@@ -53,3 +54,83 @@ def test_fix_file_preserves_comment_and_root_attributes_on_stdout(monkeypatch, c
         "<!-- File generated by GiBUU. For documentation see "
         "https://gibuu.hepforge.org/trac/wiki/LesHouches -->"
     ) in output
+
+
+def test_fix_file_durable_replaces_file(tmp_path, capsys):
+    input_file = tmp_path / "input.lhe"
+    input_file.write_text(
+        Path(skhep_testdata.data_path("pylhe-testlhef3.lhe")).read_text(),
+        encoding="utf-8",
+    )
+
+    fix_file(filepath=str(input_file), suffix=".lhe", durable=True)
+
+    assert "processed" in capsys.readouterr().out
+    assert [path.name for path in tmp_path.iterdir()] == ["input.lhe"]
+    assert pylhe.LHEFile.count_events(input_file) > 0
+
+
+def _write_lhe(path: Path, num_events: int) -> str:
+    event = (
+        "<event>\n"
+        " 2 1 +1.0e+00 9.1e+01 7.5e-03 1.2e-01\n"
+        " 21 -1 0 0 501 502 0.0 0.0 4.5e+01 4.5e+01 0.0 0.0 9.0\n"
+        " 21 -1 0 0 502 501 0.0 0.0 -4.5e+01 4.5e+01 0.0 0.0 9.0\n"
+        "</event>\n"
+    )
+    path.write_text(
+        '<LesHouchesEvents version="3.0">\n<init>\n'
+        "2212 2212 6.5e+03 6.5e+03 0 0 247000 247000 -4 1\n"
+        "1.0e+01 1.0e-01 1.0e+00 1\n</init>\n"
+        + event * num_events
+        + "</LesHouchesEvents>\n"
+    )
+    return str(path)
+
+
+def test_main_jobs_matches_serial(tmp_path, monkeypatch, capsys):
+    outputs = {}
+    for jobs in ("1", "2"):
+        directory = tmp_path / f"jobs{jobs}"
+        directory.mkdir()
+        files = [
+            _write_lhe(directory / f"input{i}.lhe", num_events)
+            for i, num_events in enumerate((1, 3, 2))
+        ]
+        monkeypatch.setattr(
+            sys, "argv", ["lhefix", "--suffix", ".fix.lhe", "-j", jobs, *files]
+        )
+        main()
+        outputs[jobs] = {
+            path.name: path.read_text() for path in directory.glob("*.fix.lhe")
+        }
+    capsys.readouterr()
+
+    assert sorted(outputs["1"]) == [
+        "input0.fix.lhe",
+        "input1.fix.lhe",
+        "input2.fix.lhe",
+    ]
+    assert outputs["2"] == outputs["1"]
+    for name, num_events in zip(sorted(outputs["1"]), (1, 3, 2), strict=True):
+        assert outputs["1"][name].count("<event>") == num_events
+
+
+def test_main_durable_dir_skips_failed_files(tmp_path, monkeypatch, capsys):
+    good_dir = tmp_path / "good"
+    bad_dir = tmp_path / "bad"
+    good_dir.mkdir()
+    bad_dir.mkdir()
+    good = _write_lhe(good_dir / "input.lhe", 2)
+    bad = bad_dir / "input.lhe"
+    bad.write_text("not an LHE file\n")
+
+    synced = []
+    monkeypatch.setattr(lhefix, "_sync_directory", synced.append)
+    monkeypatch.setattr(
+        sys, "argv", ["lhefix", "--suffix", ".lhe", "--durable", "dir", good, str(bad)]
+    )
+    main()
+
+    assert f"Error fixing {bad}" in capsys.readouterr().err
+    assert synced == [str(good_dir)]
@@ -1,8 +1,19 @@
+import functools
+import sys
 from pathlib import Path
+from typing import TextIO
 
+import pytest
 import skhep_testdata
 
-from lheutils.cli.lheinfo import get_lheinfo
+from lheutils.cli.lheinfo import (
+    ChannelKey,
+    LHEAccumulatedInfo,
+    LHEChannel,
+    get_lheinfo,
+    get_lhesummary,
+    main,
+)
 
 
 def test_get_lheinfo_reports_initrwgt_weight_groups():
@@ -80,3 +91,110 @@ def test_get_lheinfo_reports_zero_weighted_events(tmp_path, capsys):
     acc.print()
     summary = capsys.readouterr().out
     assert f"zero: {acc.total_zero_weighted_events / acc.total_events:.2%}" in summary
+
+
+def test_lhe_accumulated_info_merges_channels():
+    def channel(outgoing: list[int], num_events: int) -> LHEChannel:
+        return LHEChannel(
+            incoming_pdgid=[-2, 2],
+            outgoing_pdgid=outgoing,
+            num_events=num_events,
+            num_negative_events=1,
+            num_zero_events=0,
+        )
+
+    first = LHEAccumulatedInfo(
+        total_events=3,
+        total_negative_weighted_events=1,
+        total_zero_weighted_events=0,
+        total_channels=[channel([11, -11], 3)],
+    )
+    second = LHEAccumulatedInfo(
+        total_events=5,
+        total_negative_weighted_events=2,
+        total_zero_weighted_events=0,
+        total_channels=[channel([-11, 11], 4), channel([13, -13], 1)],
+    )
+
+    total = first + second
+    assert first.total_channels == [channel([11, -11], 3)]
+
+    first += second
+    assert first == total
+    assert first.total_events == 8
+    assert [ch.num_events for ch in first.total_channels] == [7, 1]
+    assert [ch.num_negative_events for ch in first.total_channels] == [2, 1]
+    # The channels are derived from the merge index and cannot go stale
+    with pytest.raises(AttributeError):
+        first.total_channels = []  # type: ignore[misc]
+
+
+def test_lhe_channel_key_is_computed_once_per_channel(monkeypatch):
+    calls = 0
+    compute_key = LHEChannel.__dict__["key"].func
+
+    def counting_key(self: LHEChannel) -> ChannelKey:
+        nonlocal calls
+        calls += 1
+        return compute_key(self)
+
+    key = functools.cached_property(counting_key)
+    key.__set_name__(LHEChannel, "key")
+    monkeypatch.setattr(LHEChannel, "key", key)
+
+    def file_info() -> LHEAccumulatedInfo:
+        return LHEAccumulatedInfo(
+            total_events=6,
+            total_negative_weighted_events=0,
+            total_zero_weighted_events=0,
+            total_channels=[
+                LHEChannel(
+                    incoming_pdgid=[-2, 2],
+                    outgoing_pdgid=[pdgid, -pdgid],
+                    num_events=1,
+                    num_negative_events=0,
+                    num_zero_events=0,
+                )
+                for pdgid in range(11, 17)
+            ],
+        )
+
+    infos = [file_info() for _ in range(3)]
+    acc = LHEAccumulatedInfo(
+        total_events=0,
+        total_negative_weighted_events=0,
+        total_zero_weighted_events=0,
+        total_channels=[],
+    )
+    for info in infos:
+        acc += info
+    acc = acc + infos[0]
+
+    assert acc.total_events == 24
+    assert calls == 18
+
+
+def test_get_lhesummary_jobs_matches_serial(capsys):
+    input_files: list[str | TextIO] = [
+        skhep_testdata.data_path("pylhe-testlhef3.lhe"),
+        skhep_testdata.data_path("pylhe-testfile-madgraph-2.2.1-Z-ckkwl.lhe.gz"),
+    ]
+
+    serial = get_lhesummary(input_files, channels=True)
+    serial_output = capsys.readouterr().out
+    parallel = get_lhesummary(input_files, channels=True, jobs=2)
+
+    assert parallel == serial
+    assert capsys.readouterr().out == serial_output
+
+
+def test_main_skips_path_below_a_file(tmp_path, monkeypatch, capsys):
+    parent = tmp_path / "events.lhe"
+    parent.write_text("")
+    monkeypatch.setattr(sys, "argv", ["lheinfo", str(parent / "missing.lhe")])
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 1
+    assert "No valid files found" in capsys.readouterr().err
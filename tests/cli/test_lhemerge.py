@@ -71,3 +71,36 @@ def test_merge_lhe_files_rejects_different_initrwgt(tmp_path):
 
     assert code == 1
     assert "different initrwgt header sections" in message
+
+
+def _write_lhe(path: Path, num_events: int) -> str:
+    event = (
+        "<event>\n"
+        " 2 1 +1.0e+00 9.1e+01 7.5e-03 1.2e-01\n"
+        " 21 -1 0 0 501 502 0.0 0.0 4.5e+01 4.5e+01 0.0 0.0 9.0\n"
+        " 21 -1 0 0 502 501 0.0 0.0 -4.5e+01 4.5e+01 0.0 0.0 9.0\n"
+        "</event>\n"
+    )
+    path.write_text(
+        '<LesHouchesEvents version="3.0">\n<init>\n'
+        "2212 2212 6.5e+03 6.5e+03 0 0 247000 247000 -4 1\n"
+        "1.0e+01 1.0e-01 1.0e+00 1\n</init>\n"
+        + event * num_events
+        + "</LesHouchesEvents>\n"
+    )
+    return str(path)
+
+
+def test_merge_lhe_files_compresses_gz_output(tmp_path):
+    output_file = tmp_path / "out.lhe.gz"
+
+    code, message = merge_lhe_files(
+        [_write_lhe(tmp_path / "a.lhe", 2), _write_lhe(tmp_path / "b.lhe", 3)],
+        output_file=str(output_file),
+    )
+
+    assert code == 0, message
+    assert output_file.read_bytes()[:2] == b"\x1f\x8b"
+    merged = pylhe.LHEFile.fromfile(output_file)
+    assert merged.init.initInfo.numProcesses == 1
+    assert len(list(merged.events)) == 5
@@ -1,9 +1,17 @@
 import doctest
+import sys
 
 import pylhe
+import pytest
 import skhep_testdata
 
-from lheutils.cli.lheshow import _format_event_pretty, show_event, show_init
+from lheutils.cli.lheshow import (
+    _format_event_pretty,
+    main,
+    show_event,
+    show_events,
+    show_init,
+)
 
 
 def _assert_matches_with_ellipsis(actual: str, expected: str) -> None:
@@ -173,3 +181,103 @@ def test_format_event_pretty_shows_weight_variations_on_separate_lines():
         "    '1001': 1.25 (+25%)\n"
         "    '1002': 0.8 (-20%)"
     ) in output
+
+
+def test_show_event_from_file_matches_stdin(monkeypatch, capsys):
+    input_file = skhep_testdata.data_path("pylhe-testlhef3.lhe")
+
+    show_event(input_file, 2, output_format="repr")
+    from_file = capsys.readouterr().out
+
+    with open(input_file, encoding="utf-8") as handle:
+        monkeypatch.setattr(sys, "stdin", handle)
+        show_event(sys.stdin, 2, output_format="repr")
+    assert capsys.readouterr().out == from_file
+
+
+def test_show_events_matches_single_events(capsys):
+    input_file = skhep_testdata.data_path("pylhe-testlhef3.lhe")
+
+    show_event(input_file, 2, output_format="repr")
+    show_event(input_file, 3, output_format="repr")
+    single_events = capsys.readouterr().out
+
+    show_events(input_file, (2, 3), output_format="repr")
+    assert capsys.readouterr().out == single_events
+
+
+def test_main_skips_path_below_a_file(tmp_path, monkeypatch, capsys):
+    parent = tmp_path / "events.lhe"
+    parent.write_text("")
+    monkeypatch.setattr(sys, "argv", ["lheshow", "--init", str(parent / "missing.lhe")])
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 1
+    assert "No valid files found" in capsys.readouterr().err
+
+
+def test_show_events_past_end_on_stdin_reports_event_count(monkeypatch, capsys):
+    input_file = skhep_testdata.data_path("pylhe-testlhef3.lhe")
+    num_events = pylhe.LHEFile.count_events(input_file)
+
+    with open(input_file, encoding="utf-8") as handle:
+        monkeypatch.setattr(sys, "stdin", handle)
+        with pytest.raises(SystemExit) as excinfo:
+            show_events(sys.stdin, (num_events, num_events + 4), output_format="repr")
+
+    assert excinfo.value.code == 1
+    captured = capsys.readouterr()
+    assert captured.out.startswith("LHEEvent(")
+    assert f"File has {num_events} events." in captured.err
+
+
+def _write_lhe(path, num_events: int) -> str:
+    event = (
+        "<event>\n"
+        " 2 1 +1.0e+00 9.1e+01 7.5e-03 1.2e-01\n"
+        " 21 -1 0 0 501 502 0.0 0.0 4.5e+01 4.5e+01 0.0 0.0 9.0\n"
+        " 21 -1 0 0 502 501 0.0 0.0 -4.5e+01 4.5e+01 0.0 0.0 9.0\n"
+        "</event>\n"
+    )
+    path.write_text(
+        '<LesHouchesEvents version="3.0">\n<init>\n'
+        "2212 2212 6.5e+03 6.5e+03 0 0 247000 247000 -4 1\n"
+        "1.0e+01 1.0e-01 1.0e+00 1\n</init>\n"
+        + event * num_events
+        + "</LesHouchesEvents>\n"
+    )
+    return str(path)
+
+
+def _run_main(monkeypatch, capsys, *args: str) -> tuple[str, str, int]:
+    monkeypatch.setattr(sys, "argv", ["lheshow", *args])
+    try:
+        main()
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    captured = capsys.readouterr()
+    return captured.out, captured.err, code
+
+
+def test_main_jobs_matches_serial(tmp_path, monkeypatch, capsys):
+    first = _write_lhe(tmp_path / "first.lhe", 3)
+    short = _write_lhe(tmp_path / "short.lhe", 1)
+    last = _write_lhe(tmp_path / "last.lhe", 2)
+
+    for files, expected_code in (([first, last], 0), ([first, short, last], 1)):
+        args = [*files, "--event", "2", "--format", "repr"]
+        serial = _run_main(monkeypatch, capsys, *args)
+        parallel = _run_main(monkeypatch, capsys, *args, "-j", "2")
+
+        assert parallel == serial
+        out, err, code = serial
+        assert code == expected_code
+        assert out.startswith(f"=== {first} ===\nLHEEvent(")
+        if expected_code:
+            assert f"not found in {short}" in err
+            assert last not in out
+        else:
+            assert out.index(first) < out.index(last)
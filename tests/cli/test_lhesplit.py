@@ -1,7 +1,7 @@
 import pylhe
 import skhep_testdata
 
-from lheutils.cli.lhesplit import split_lhe_file
+from lheutils.cli.lhesplit import _split_output_base, split_lhe_file
 
 
 def test_split_lhe_file_preserves_initrwgt_header(tmp_path):
@@ -46,3 +46,66 @@ def test_split_lhe_file_preserves_comment_and_root_attributes(tmp_path):
         "<!-- File generated by GiBUU. For documentation see "
         "https://gibuu.hepforge.org/trac/wiki/LesHouches -->"
     ) in output_text
+
+
+def test_split_lhe_file_writes_no_empty_trailing_file(tmp_path):
+    input_file = skhep_testdata.data_path("pylhe-testlhef3.lhe")
+    num_events = pylhe.LHEFile.count_events(input_file)
+    output_base = tmp_path / "split_exact.lhe"
+
+    code, message = split_lhe_file(input_file, str(output_base), num_events=1)
+
+    assert code == 0
+    assert (
+        message
+        == f"Split events into {num_events} files with base name '{output_base}'."
+    )
+    assert len(list(tmp_path.iterdir())) == num_events
+    assert pylhe.LHEFile.count_events(tmp_path / f"split_exact_{num_events}.lhe") == 1
+
+
+def test_split_lhe_file_copies_raw_events(tmp_path):
+    input_file = skhep_testdata.data_path("pylhe-testlhef3.lhe")
+    output_base = tmp_path / "split_raw.lhe.gz"
+
+    code, _ = split_lhe_file(input_file, str(output_base), num_events=2)
+
+    assert code == 0
+    split_events = [
+        event
+        for path in sorted(tmp_path.glob("split_raw_*.lhe.gz"))
+        for event in pylhe.LHEFile.fromfile(path).events
+    ]
+    assert split_events == list(pylhe.LHEFile.fromfile(input_file).events)
+
+
+def test_split_output_base_ignores_dots_in_directories():
+    assert _split_output_base("./run.1/out.lhe.gz") == ("./run.1/out", ".lhe.gz")
+    assert _split_output_base("out") == ("out", "")
+
+
+def test_split_lhe_file_compresses_gz_outputs(tmp_path):
+    input_file = skhep_testdata.data_path("pylhe-testlhef3.lhe")
+
+    for n, weight_format in enumerate((None, pylhe.LHEWeightFormat.WEIGHTS)):
+        output_base = tmp_path / f"split_{n}.lhe.gz"
+        code, _ = split_lhe_file(
+            input_file,
+            str(output_base),
+            num_events=100,
+            weight_format=weight_format,
+            compresslevel=1,
+        )
+
+        assert code == 0
+        with (tmp_path / f"split_{n}_1.lhe.gz").open("rb") as f:
+            assert f.read(2) == b"\x1f\x8b"
+
+
+def test_split_lhe_file_reports_missing_input(tmp_path):
+    missing = tmp_path / "missing.lhe"
+
+    code, message = split_lhe_file(str(missing), str(tmp_path / "out.lhe"), 1)
+
+    assert code == 1
+    assert message.startswith(f"Error reading input file '{missing}'")